@@ -6,8 +6,8 @@ from abc import ABC
 from abc import abstractmethod
 from collections.abc import Hashable
 from collections.abc import MutableMapping
-from copy import deepcopy
 from enum import Enum
+from functools import lru_cache
 from pathlib import Path
 from pathlib import PurePath
 from pathlib import PurePosixPath
@@ -19,6 +19,8 @@ from typing import Iterator
 from typing import List
 from typing import Optional
 from typing import Union
+from urllib.parse import unquote
+from urllib.parse import urlsplit
 
 from paquo._logging import get_logger
 from paquo._logging import redirect
@@ -42,6 +44,36 @@ if TYPE_CHECKING:
 
 _log = get_logger(__name__)
 
+# windows network share paths, i.e. "//share/directory/..."
+_WIN_SHARE_RE = re.compile(r"//(?P<share>[^/]+)/(?P<directory>[^/]+)/")
+
+
+def _is_win_drive_path(s: str) -> bool:
+    """check if a uri path encodes a windows drive, i.e. "/X:/...\"
+
+    constant-time character test: this runs for every uri paquo parses,
+    so don't pay for a regex (or bytes round trip) per call
+    """
+    drive = s[1:2]
+    return (
+        len(s) >= 5
+        and s[0] == "/"
+        and "A" <= drive <= "Z"
+        and s[2] == ":"
+        and s[3] == "/"
+        and s[4] != "/"
+    )
+
+
+@lru_cache(maxsize=512)
+def _jstr(s: str):
+    """cache the java.lang.String instances for repeated python strings
+
+    metadata and property accesses tend to reuse a small set of keys, so
+    caching saves the wrapper construction on every jvm crossing
+    """
+    return String(s)
+
 
 # [URI:java-python]
 # NOTE: pathlib handles URIs a little different to QuPath's java URIs
@@ -65,6 +97,26 @@ def _normalize_pathlib_uris(uri):
     )
 
 
+# characters java.net.URI would reject (and malformed percent escapes):
+# when we hit any of these we defer to the java parser for its exceptions
+_URI_NEEDS_JAVA_RE = re.compile(
+    r"[^A-Za-z0-9%:/?#\[\]@!$&'()*+,;=._~-]|%(?![0-9A-Fa-f]{2})"
+)
+
+
+def _file_uri_path_str(uri: str) -> Optional[str]:
+    """pure-python extraction of the decoded path of a well-formed file: URI
+
+    returns None when the URI needs the java fallback in path_from_uri.
+    See note [URI:java-python] for why we mirror java.net.URI semantics.
+    """
+    if not uri.startswith("file:"):
+        return None
+    if _URI_NEEDS_JAVA_RE.search(uri):
+        return None
+    return unquote(urlsplit(uri).path)
+
+
 class ImageProvider(ABC):
     """Maps image ids to paths and paths to image ids."""
 
@@ -93,20 +145,23 @@ class ImageProvider(ABC):
         Parses an URI representing a file system path into a Path.
         """
         # TODO: needs way more tests... See note [URI:java-python]
-        try:
-            java_uri = URI(uri)
-        except URISyntaxException:
-            raise ValueError(f"not a valid uri '{uri}'")
-        # test current scheme support
-        if str(java_uri.getScheme()) != "file":
-            raise NotImplementedError("paquo only supports file:/ URIs as of now")
-        else:
-            path_str = str(java_uri.getPath())
+        # fast path: well-formed file: URIs don't need a java URI round trip
+        path_str = _file_uri_path_str(uri)
+        if path_str is None:
+            try:
+                java_uri = URI(uri)
+            except URISyntaxException:
+                raise ValueError(f"not a valid uri '{uri}'")
+            # test current scheme support
+            if str(java_uri.getScheme()) != "file":
+                raise NotImplementedError("paquo only supports file:/ URIs as of now")
+            else:
+                path_str = str(java_uri.getPath())
         # fixme: this should be replaced with something more reliable...
         # check if we encode a windows path
-        if re.match(r"/[A-Z]:/[^/]", path_str):
+        if _is_win_drive_path(path_str):
             return PureWindowsPath(path_str[1:])
-        elif re.match(r"//(?P<share>[^/]+)/(?P<directory>[^/]+)/", path_str):
+        elif _WIN_SHARE_RE.match(path_str):
             return PureWindowsPath(path_str)
         else:
             return PurePosixPath(path_str)
@@ -136,6 +191,14 @@ class ImageProvider(ABC):
         Test if two URIs point two the same resource
         """
         # TODO: needs way more tests... See note [URI:java-python]
+        # fast path: file: URIs compare on their decoded components,
+        # which matches the java URI identity used below
+        sa, sb = urlsplit(a), urlsplit(b)
+        if sa.scheme == "file" == sb.scheme:
+            return (
+                (sa.netloc, unquote(sa.path), unquote(sa.query), sa.fragment)
+                == (sb.netloc, unquote(sb.path), unquote(sb.query), sb.fragment)
+            )
         uri_a = _normalize_pathlib_uris(a)
         uri_b = _normalize_pathlib_uris(b)
         return bool(uri_a.equals(uri_b))
@@ -175,10 +238,27 @@ class SimpleURIImageProvider:
 
     class URIString(str):
         """string uri's can differ in their string representation and still be identical"""
-        # we need some way to normalize uris
+        # we normalize once at construction so that comparisons and
+        # hashing don't construct java URIs over and over again
+        _norm: str
+
+        def __new__(cls, value):
+            obj = super().__new__(cls, value)
+            try:
+                obj._norm = str(_normalize_pathlib_uris(str(value)).toString())
+            except URISyntaxException:  # pragma: no cover
+                obj._norm = str(value)
+            return obj
+
         def __eq__(self, other):  # pragma: no cover
-            return ImageProvider.compare_uris(self, other)
-        __hash__ = str.__hash__  # fixme: this is not correct!
+            if isinstance(other, SimpleURIImageProvider.URIString):
+                return self._norm == other._norm
+            elif isinstance(other, str):
+                return self._norm == SimpleURIImageProvider.URIString(other)._norm
+            return NotImplemented
+
+        def __hash__(self):  # pragma: no cover
+            return hash(self._norm)
 
     def uri(self, image_id: SimpleFileImageId) -> Optional['URIString']:
         """accepts a path and returns a URIString"""
@@ -203,9 +283,12 @@ class SimpleURIImageProvider:
 # noinspection PyPep8Naming
 class _RecoveredReadOnlyImageServer:
     """internal. used to allow access to image server metadata recovered from project.qpproj"""
+    __slots__ = ('_metadata', '_fake_metadata')
 
     # noinspection PyMethodParameters,PyPep8Naming
     class _FakeResolutionLevel:
+        __slots__ = ('_lvl',)
+
         def __init__(self_, _lvl):
             self_._lvl = _lvl
 
@@ -220,21 +303,27 @@ class _RecoveredReadOnlyImageServer:
 
     # noinspection PyMethodParameters,PyPep8Naming
     class _FakeMetadata:
-        def __init__(self_, _metadata):
-            self_._md = _metadata
+        __slots__ = ('_levels',)
+
+        def __init__(self_, _levels):
+            self_._levels = _levels
 
         def nLevels(self_):
-            return len(self_._md.get('levels', []))
+            return len(self_._levels)
 
         def getLevel(self_, idx):
-            _rl = self_._md.get('levels')[idx]
-            # noinspection PyProtectedMember
-            return _RecoveredReadOnlyImageServer._FakeResolutionLevel(_rl)
+            return self_._levels[idx]
 
     def __init__(self, entry_path: Path):
         server_json_f = Path(entry_path) / "server.json"
         with server_json_f.open('r') as f:
             self._metadata = json.load(f).get('metadata', {})
+        # build the fake java metadata interface once: this server is
+        # readonly so there's no need for defensive copies per access
+        self._fake_metadata = _RecoveredReadOnlyImageServer._FakeMetadata([
+            _RecoveredReadOnlyImageServer._FakeResolutionLevel(lvl)
+            for lvl in self._metadata.get('levels', [])
+        ])
 
     def getWidth(self):
         return self._metadata['width']
@@ -253,13 +342,12 @@ class _RecoveredReadOnlyImageServer:
 
     def getMetadata(self) -> Any:
         # fake the java metadata interface
-        _md = deepcopy(self._metadata)
-        # noinspection PyProtectedMember
-        return _RecoveredReadOnlyImageServer._FakeMetadata(_md)
+        return self._fake_metadata
 
 
 class _ProjectImageEntryMetadata(MutableMapping):
     """provides a python dict interface for image entry metadata"""
+    __slots__ = ('_image', '_entry')
 
     def __init__(self, image: 'QuPathProjectImageEntry') -> None:
         self._image = image
@@ -273,7 +361,7 @@ class _ProjectImageEntryMetadata(MutableMapping):
             raise TypeError(f"key must be of type `str` got `{type(k)}`")
         if not isinstance(v, str):
             raise TypeError(f"value must be of type `str` got `{type(v)}`")
-        self._entry.putMetadataValue(String(str(k)), String(str(v)))
+        self._entry.putMetadataValue(_jstr(k), _jstr(v))
 
     def __delitem__(self, k: str) -> None:
         # noinspection PyProtectedMember
@@ -281,12 +369,12 @@ class _ProjectImageEntryMetadata(MutableMapping):
             raise AttributeError("project in readonly mode")
         if not isinstance(k, str):
             raise TypeError(f"key must be of type `str` got `{type(k)}`")
-        self._entry.removeMetadataValue(String(str(k)))
+        self._entry.removeMetadataValue(_jstr(k))
 
     def __getitem__(self, k: str) -> str:
         if not isinstance(k, str):
             raise TypeError(f"key must be of type `str` got `{type(k)}`")
-        v = self._entry.getMetadataValue(String(str(k)))
+        v = self._entry.getMetadataValue(_jstr(k))
         if v is None:
             raise KeyError(f"'{k}' not in metadata")
         return str(v)
@@ -295,10 +383,15 @@ class _ProjectImageEntryMetadata(MutableMapping):
         return int(self._entry.getMetadataKeys().size())
 
     def __iter__(self) -> Iterator[str]:
-        return iter(map(str, self._entry.getMetadataKeys()))
+        # iterate the java key set lazily instead of materializing it
+        it = self._entry.getMetadataKeys().iterator()
+        while it.hasNext():
+            yield str(it.next())
 
     def __contains__(self, item):
-        return bool(self._entry.containsMetadata(String(str(item))))
+        if not isinstance(item, str):
+            return False
+        return bool(self._entry.containsMetadata(_jstr(item)))
 
     def clear(self) -> None:
         # noinspection PyProtectedMember
@@ -306,12 +399,47 @@ class _ProjectImageEntryMetadata(MutableMapping):
             raise AttributeError("project in readonly mode")
         self._entry.clearMetadata()
 
+    def _bulk_set(self, mapping: Dict[str, str]) -> None:
+        """set many metadata key value pairs in one go
+
+        note: the qupath entry doesn't expose a bulk putAll interface,
+          so marshal all keys and values upfront and loop over the bound
+          java method. this skips the per-item readonly and type checks
+          that MutableMapping.update would do via __setitem__.
+        """
+        # noinspection PyProtectedMember
+        if self._image._readonly:
+            raise AttributeError("project in readonly mode")
+        items = []
+        for k, v in mapping.items():
+            if not isinstance(k, str):
+                raise TypeError(f"key must be of type `str` got `{type(k)}`")
+            if not isinstance(v, str):
+                raise TypeError(f"value must be of type `str` got `{type(v)}`")
+            items.append((_jstr(k), _jstr(v)))
+        put_metadata_value = self._entry.putMetadataValue
+        for jk, jv in items:
+            put_metadata_value(jk, jv)
+
+    def update(self, *args, **kwargs) -> None:
+        if len(args) == 1 and isinstance(args[0], dict) and not kwargs:
+            self._bulk_set(args[0])
+        else:
+            super().update(*args, **kwargs)
+
+    def items(self):
+        # single pass over the keys: the MutableMapping default would
+        # pay an extra contains check per key via __getitem__
+        get_value = self._entry.getMetadataValue
+        return {k: str(get_value(_jstr(k))) for k in self}.items()
+
     def __repr__(self):
-        return f"Metadata({repr(dict(self))})"
+        return f"Metadata({dict(self.items())!r})"
 
 
 class _ImageDataProperties(MutableMapping):
     """provides a python dict interface for image data properties"""
+    __slots__ = ('_image', '_image_data')
 
     def __init__(self, image: 'QuPathProjectImageEntry') -> None:
         self._image = image
@@ -324,7 +452,7 @@ class _ImageDataProperties(MutableMapping):
             raise AttributeError("project in readonly mode")
         if not isinstance(k, str):
             raise TypeError(f"key must be of type `str` got `{type(k)}`")
-        self._image_data.setProperty(String(k), v)
+        self._image_data.setProperty(_jstr(k), v)
 
     def __delitem__(self, k: str) -> None:
         # noinspection PyProtectedMember
@@ -332,31 +460,47 @@ class _ImageDataProperties(MutableMapping):
             raise AttributeError("project in readonly mode")
         if not isinstance(k, str):
             raise TypeError(f"key must be of type `str` got `{type(k)}`")
-        self._image_data.removeProperty(String(k))
+        self._image_data.removeProperty(_jstr(k))
 
     def __getitem__(self, k: str) -> Any:
         if not isinstance(k, str):
             raise TypeError(f"key must be of type `str` got `{type(k)}`")
-        if k not in self:
+        v = self._image_data.getProperty(_jstr(k))
+        if v is None and k not in self:
+            # only pay for the extra containsKey crossing when the
+            # property is absent (or stored as an explicit null)
             raise KeyError(f"'{k}' not in metadata")
-        v = self._image_data.getProperty(String(k))
         return v
 
     def __contains__(self, item: Any) -> bool:
         if not isinstance(item, str):
             return False
         return bool(
-            self._image_data.getProperties().containsKey(String(item))
+            self._image_data.getProperties().containsKey(_jstr(item))
         )
 
     def __len__(self) -> int:
         return int(self._image_data.getProperties().size())
 
     def __iter__(self) -> Iterator[str]:
-        return iter(map(str, dict(self._image_data.getProperties())))
+        # iterate the keys lazily: converting the java map to a dict
+        # would marshal every value just to throw it away
+        it = self._image_data.getProperties().keySet().iterator()
+        while it.hasNext():
+            yield str(it.next())
+
+    def items(self):
+        # single pass over the java entry set instead of a contains
+        # plus get round trip per key via the MutableMapping default
+        it = self._image_data.getProperties().entrySet().iterator()
+        d = {}
+        while it.hasNext():
+            e = it.next()
+            d[str(e.getKey())] = e.getValue()
+        return d.items()
 
     def __repr__(self):
-        return f"Properties({repr(dict(self))})"
+        return f"Properties({dict(self.items())!r})"
 
 
 # note: this could just be autogenerated by inspecting the ImageType
@@ -375,10 +519,10 @@ class QuPathImageType(str, Enum):
     @classmethod
     def from_java(cls, java_enum) -> 'QuPathImageType':
         """internal for converting from java to python"""
-        for value in cls.__members__.values():
-            if value.java_enum == java_enum:
-                return value
-        raise ValueError("unsupported java_enum")  # pragma: no cover
+        try:
+            return _IMAGE_TYPE_FROM_JAVA[int(java_enum.ordinal())]
+        except (AttributeError, KeyError, TypeError):
+            raise ValueError("unsupported java_enum")  # pragma: no cover
 
     # Brightfield image with hematoxylin and DAB stains.
     BRIGHTFIELD_H_DAB = ("Brightfield (H-DAB)", ImageType.BRIGHTFIELD_H_DAB)
@@ -394,6 +538,12 @@ class QuPathImageType(str, Enum):
     UNSET = ("Not set", ImageType.UNSET)
 
 
+# reverse lookup table for QuPathImageType.from_java, keyed by the java
+# enum ordinal: java enums are reference unique, so the ordinal identifies
+# the member without dispatching to java equals/hashCode on every lookup
+_IMAGE_TYPE_FROM_JAVA = {int(m.java_enum.ordinal()): m for m in QuPathImageType}
+
+
 class QuPathProjectImageEntry:
     java_object: DefaultProjectImageEntry
 
@@ -408,6 +558,7 @@ class QuPathProjectImageEntry:
         self.java_object = entry
         self._project_ref = weakref.ref(_project_ref) if _project_ref else lambda: None
         self._metadata = _ProjectImageEntryMetadata(self)
+        self._image_name_cache: Optional[str] = None
 
     @property
     def _readonly(self):
@@ -448,26 +599,33 @@ class QuPathProjectImageEntry:
                 raise
         return server
 
-    @property
+    @cached_property
     def entry_id(self) -> str:
         """the unique image entry id"""
+        # note: immutable for a given entry, so safe to cache
         return str(self.java_object.getID())
 
-    @property
+    @cached_property
     def entry_path(self) -> Path:
         """path to the image directory"""
+        # note: immutable for a given entry, so safe to cache
         return Path(str(self.java_object.getEntryPath().toString()))
 
     @property
     def image_name(self) -> str:
         """the image entry name"""
-        return str(self.java_object.getImageName())
+        name = self._image_name_cache
+        if name is None:
+            name = self._image_name_cache = str(self.java_object.getImageName())
+        return name
 
     @image_name.setter
     def image_name(self, name: str) -> None:
         if self._readonly:
             raise AttributeError("project in readonly mode")
         self.java_object.setImageName(String(name))
+        # refetch on next access (qupath might normalize the name)
+        self._image_name_cache = None
 
     # remove until there's a good use case for this...
     # @property
@@ -538,15 +696,15 @@ class QuPathProjectImageEntry:
         on which image backend is used by QuPath
         """
         md = self._image_server.getMetadata()
-        levels = []
-        for level in range(int(md.nLevels())):
-            resolution_level = md.getLevel(level)
-            levels.append({
-                'downsample': float(resolution_level.getDownsample()),
-                'width': int(resolution_level.getWidth()),
-                'height': int(resolution_level.getHeight()),
-            })
-        return levels
+        get_level = md.getLevel
+        return [
+            {
+                'downsample': float(lvl.getDownsample()),
+                'width': int(lvl.getWidth()),
+                'height': int(lvl.getHeight()),
+            }
+            for lvl in map(get_level, range(int(md.nLevels())))
+        ]
 
     @property
     def metadata(self) -> _ProjectImageEntryMetadata:
@@ -668,10 +826,16 @@ class QuPathProjectImageEntry:
             raise NotImplementedError("unsupported in paquo as of now")
         return str(uris[0].toString())
 
+    @cached_property
+    def _concrete_path(self) -> Path:
+        # note: safe to cache as long as the server uris don't change.
+        #   QuPathProject.update_image_paths drops this cache when it
+        #   rewrites the uris of an entry.
+        return Path(ImageProvider.path_from_uri(self.uri))
+
     def is_readable(self) -> bool:
         """check if the image file is readable"""
-        concrete_path = Path(ImageProvider.path_from_uri(self.uri))
-        return concrete_path.is_file()
+        return self._concrete_path.is_file()
 
     def is_changed(self) -> bool:
         """check if image_data is changed
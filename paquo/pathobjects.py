@@ -2,7 +2,9 @@ import json
 import math
 from collections.abc import MutableMapping
 from typing import Callable
+from typing import Iterable
 from typing import Iterator
+from typing import List
 from typing import Optional
 from typing import Type
 from typing import TypeVar
@@ -172,6 +174,34 @@ class _PathROIObject:
             obj.measurements.update(measurements)
         return obj
 
+    @classmethod
+    def from_shapely_batch(
+        cls: Type[PathROIObjectType],
+        rois: Iterable[BaseGeometry],
+    ) -> List[PathROIObjectType]:
+        """create multiple Path Objects from an iterable of shapely shapes
+
+        faster than calling `from_shapely` in a loop: a single WKBReader
+        and the bound conversion helpers are reused for all shapes
+
+        Parameters
+        ----------
+        rois:
+            shapely shapes as the regions of interest of the objects
+
+        """
+        wkb_reader = WKBReader()
+        geometry_to_roi = GeometryTools.geometryToROI
+        factory = cls.java_class_factory
+        path_objects = []
+        for roi in rois:
+            if not isinstance(roi, BaseGeometry):
+                raise TypeError("roi needs to be an instance of shapely.geometry.base.BaseGeometry")
+            jts_geometry = wkb_reader.read(shapely_wkb_dumps(roi))
+            java_obj = factory(geometry_to_roi(jts_geometry, None), None, None)
+            path_objects.append(cls(java_obj))
+        return path_objects
+
     @classmethod
     def from_geojson(cls: Type[PathROIObjectType], geojson) -> PathROIObjectType:
         """create a new Path Object from geojson"""
@@ -62,6 +62,11 @@ class _ProjectImageEntriesProxy(collections_abc.Sequence):
         if not isinstance(project.java_object, DefaultProject):
             raise TypeError('requires DefaultProject instance')  # pragma: no cover
         self._project = project
+        # the absolute project path is constant for this proxy:
+        # resolve it once instead of per entry in _key_func
+        self._project_path = str(
+            project.java_object.getPath().toAbsolutePath().toString()
+        )
         self._images = {
             self._key_func(entry): QuPathProjectImageEntry(entry, _project_ref=self._project)
             for entry in self._project.java_object.getImageList()
@@ -75,7 +80,7 @@ class _ProjectImageEntriesProxy(collections_abc.Sequence):
         # basically `DefaultProjectImageEntry.getFullProjectEntryID()`
         # but don't go via image_data
         return (
-            str(self._project.java_object.getPath().toAbsolutePath().toString()),
+            self._project_path,
             str(entry.getID()),
         )
 
@@ -315,7 +320,7 @@ class QuPathProject:
         try:
             support = ImageServerProvider.getPreferredUriImageSupport(
                 BufferedImage,
-                String(str(img_uri))
+                String(img_uri)  # img_uri is always a str subclass here
             )
         except IOException:  # pragma: no cover
             # it's possible that an image_provider returns an URI but that URI
@@ -431,6 +436,8 @@ class QuPathProject:
         # update uris if possible
         for image in self.images:
             image.java_object.updateServerURIs(uri2uri)
+            # the cached filesystem path might be stale now
+            image.__dict__.pop('_concrete_path', None)
 
     @property
     def uri(self) -> str:
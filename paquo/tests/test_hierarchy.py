@@ -33,12 +33,11 @@ _T = TypeVar('_T', bound=_PathROIObject)
 
 def _make_polygons(obj_cls: Type[_T], amount: int) -> List[_T]:
     """returns a list of amount Path Objects"""
-    path_objects = []
-    for x in range(0, 10 * amount, 10):
-        roi = shapely.geometry.Polygon.from_bounds(x, 0, x+5, 5)
-        ao = obj_cls.from_shapely(roi)
-        path_objects.append(ao)
-    return path_objects
+    rois = [
+        shapely.geometry.Polygon.from_bounds(x, 0, x+5, 5)
+        for x in range(0, 10 * amount, 10)
+    ]
+    return obj_cls.from_shapely_batch(rois)
 
 
 _make_polygon_annotations = partial(_make_polygons, QuPathPathAnnotationObject)
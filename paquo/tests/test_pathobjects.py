@@ -28,6 +28,22 @@ def test_shapely_to_qupath_conversion():
     assert roi.getRoiName() == "Points"
 
 
+def test_from_shapely_batch():
+    rois = [
+        shapely.geometry.Polygon.from_bounds(x, 0, x + 5, 5)
+        for x in range(0, 30, 10)
+    ]
+    path_objects = QuPathPathAnnotationObject.from_shapely_batch(rois)
+
+    assert len(path_objects) == len(rois)
+    for path_object, roi in zip(path_objects, rois):
+        assert path_object.roi.equals(roi)
+
+    with pytest.raises(TypeError):
+        # noinspection PyTypeChecker
+        QuPathPathAnnotationObject.from_shapely_batch([123])
+
+
 @pytest.fixture(
     scope="function",
     params=[